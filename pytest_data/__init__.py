@@ -1,5 +1,3 @@
 # -*- coding: utf-8 -*-
 
-from __future__ import absolute_import
-
 from .functions import get_data, use_data, use_data_parametrize
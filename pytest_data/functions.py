@@ -4,16 +4,24 @@
 Useful functions for managing data for pytest fixtures.
 """
 
-from functools import partial
-try:
-    from itertools import cycle, islice, izip_longest as zip_longest
-except ImportError:
-    from itertools import cycle, islice, zip_longest
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional
 
 __all__ = ('get_data', 'use_data', 'use_data_parametrize')
 
+# Shared defaults for missing attributes. Never mutated, merging always copies.
+_EMPTY_DICT = {}  # type: Dict[Any, Any]
+_EMPTY_LIST = []  # type: List[Any]
+
+# Marks attribute not set on target.
+_MISSING = object()
+
+# Fetches ``(module, cls, function)`` of request in one call.
+_GET_TARGETS = attrgetter('module', 'cls', 'function')
+
 
 def get_data(request, attribute_name, default_data={}):
+    # type: (Any, str, Any) -> Any
     """
     Returns merged data from module, class and function. The most highest
     priority have data nearest to test code. It means that data on function
@@ -80,41 +88,110 @@ def get_data(request, attribute_name, default_data={}):
             user_data = get_data(request, 'user_data', {'name': 'Jerry'})
             return User(user_data)
     """
-    TARGETS = (request.module, request.cls, request.function)
+    get_data_impl = _GET_DATA_IMPLS.get(type(default_data))  # type: Optional[Callable[[Any, str, Any], Any]]
+    if get_data_impl is None:
+        if isinstance(default_data, dict):
+            get_data_impl = _get_data_dict
+        elif isinstance(default_data, list):
+            get_data_impl = _get_data_list
+        else:
+            raise ValueError('{} is not supported'.format(type(default_data)))
+    return get_data_impl(request, attribute_name, default_data)
+
+
+def _get_data_dict(request, attribute_name, default_data):
+    # type: (Any, str, Dict[Any, Any]) -> Dict[Any, Any]
+    """
+    :py:func:`get_data` for ``default_data`` of type ``dict``.
+    """
+    module, cls, function = _GET_TARGETS(request)
+    module_data = _getter_dict(module, attribute_name)
+    cls_data = _getter_dict(cls, attribute_name)
+    function_data = _getter_dict(function, attribute_name)
+    param_data = _check_dict(request, 'param', getattr(request, 'param', _MISSING))
+    return {**default_data, **module_data, **cls_data, **function_data, **param_data}
+
+
+def _get_data_list(request, attribute_name, default_data):
+    # type: (Any, str, List[Any]) -> List[Any]
+    """
+    :py:func:`get_data` for ``default_data`` of type ``list``.
+    """
+    module, cls, function = _GET_TARGETS(request)
+    dicts = [
+        default_data,
+        _getter_list(module, attribute_name),
+        _getter_list(cls, attribute_name),
+        _getter_list(function, attribute_name),
+        _check_list(request, 'param', getattr(request, 'param', _MISSING)),
+    ]
+    sources = [(item, len(item)) for item in dicts if item]
+    max_len = max([length for item, length in sources], default=0)
+    return [_merge(*[item[i % length] for item, length in sources]) for i in range(max_len)]
+
+
+# Implementation of get_data by exact type of ``default_data``. Subclasses
+# of dict or list are resolved by isinstance in get_data.
+_GET_DATA_IMPLS = {  # type: Dict[type, Callable[[Any, str, Any], Any]]
+    dict: _get_data_dict,
+    list: _get_data_list,
+}
+
+
+def _getter_dict(target, attribute_name):
+    # type: (Any, str) -> Dict[Any, Any]
+    """
+    Get ``dict`` value of ``attribute_name`` from ``target`` or empty one
+    if it's not specified.
+    """
+    return _check_dict(target, attribute_name, getattr(target, attribute_name, _MISSING))
 
-    if isinstance(default_data, dict):
-        getter = partial(_getter, attribute_name=attribute_name, default={})
-        dicts = [default_data] + list(map(getter, TARGETS)) + [_getter(request, 'param', {})]
-        data = _merge(*dicts)
 
-    elif isinstance(default_data, list):
-        getter = partial(_getter, attribute_name=attribute_name, default=[])
-        dicts = [default_data] + list(map(getter, TARGETS)) + [_getter(request, 'param', [])]
-        max_len = max(map(len, dicts))
-        data = [_merge(*datas) for datas in islice(zip_longest(*map(cycle, dicts)), max_len)]
+def _getter_list(target, attribute_name):
+    # type: (Any, str) -> List[Any]
+    """
+    Get ``list`` value of ``attribute_name`` from ``target`` or empty one
+    if it's not specified.
+    """
+    return _check_list(target, attribute_name, getattr(target, attribute_name, _MISSING))
 
-    else:
-        raise ValueError('{} is not supported'.format(type(default_data)))
 
-    return data
+def _check_dict(target, attribute_name, value):
+    # type: (Any, str, Any) -> Dict[Any, Any]
+    """
+    Return empty dict for ``_MISSING`` value, otherwise check that value
+    is ``dict`` and return it.
+    """
+    if value is _MISSING:
+        return _EMPTY_DICT
+    if not isinstance(value, dict):
+        raise ValueError('{}.{} should be {}'.format(target, attribute_name, dict))
+    return value
 
 
-def _getter(target, attribute_name, default):
+def _check_list(target, attribute_name, value):
+    # type: (Any, str, Any) -> List[Any]
     """
-    Get value of ``attribute_name`` from ``target``. If it's not specified,
-    return ``default``. Also check that value is of same type as ``default``.
+    Return empty list for ``_MISSING`` value, otherwise check that value
+    is ``list`` and return it.
     """
-    value_type = type(default)
-    value = getattr(target, attribute_name, default)
-    if not isinstance(value, value_type):
-        raise ValueError('{}.{} should be {}'.format(target, attribute_name, value_type))
+    if value is _MISSING:
+        return _EMPTY_LIST
+    if not isinstance(value, list):
+        raise ValueError('{}.{} should be {}'.format(target, attribute_name, list))
     return value
 
 
+# Overwriting keys by C-level update in priority order is faster than writing
+# every key only once from the highest priority with Python loop over items.
+# Update already resizes the result once per source, pre-sizing doesn't pay off,
+# and sources can't be reordered by size because order defines priority.
 def _merge(*dicts):
+    # type: (*Any) -> Dict[Any, Any]
     """
     Merge dictionaries together. Last one have the biggest priority.
     Order should be: default_data, module_data, cls_data, function_data.
+    Used for list data where number of non-empty items differs per row.
     """
     data = {}
     for item in dicts:
@@ -124,6 +201,7 @@ def _merge(*dicts):
 
 
 def use_data(**data):
+    # type: (**Any) -> Callable[[Any], Any]
     """
     Decorator make sexier assigning of fixture data on function. Instead of
     writing this code:
@@ -147,16 +225,20 @@ def use_data(**data):
         ``use_data`` can be used only for tests, not fixtures. So since version 0.3
         there is check that it's used only with tests (function starts with `test`).
     """
+    items = tuple(data.items())
+
     def wrapper(func):
+        # type: (Any) -> Any
         assert func.__name__.startswith('test'), 'use_data can be used only for tests'
 
-        for key, value in data.items():
+        for key, value in items:
             setattr(func, key, value)
         return func
     return wrapper
 
 
 def use_data_parametrize(**data):
+    # type: (**Any) -> Callable[[Any], Any]
     """
     :py:func:`use_data` mixed with pytest's parametrize. The best way how to
     describe it is to show some code:
@@ -195,6 +277,7 @@ def use_data_parametrize(**data):
     .. versionadded:: 0.2
     """
     def wrapper(func):
+        # type: (Any) -> Any
         func.data = data
         return func
     return wrapper
@@ -2,5 +2,10 @@
 
 
 def pytest_generate_tests(metafunc):
-    for key, value in getattr(metafunc.function, 'data', {}).items():
-        metafunc.parametrize(key, value, indirect=True)
+    # use_data_parametrize sets ``data`` directly on function, no need for getattr.
+    data = metafunc.function.__dict__.get('data')
+    if not data:
+        return
+    parametrize = metafunc.parametrize
+    for key, value in data.items():
+        parametrize(key, value, indirect=True)
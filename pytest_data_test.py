@@ -1,5 +1,8 @@
 # -*- coding: utf-8 -*-
 
+from collections import OrderedDict
+from types import SimpleNamespace
+
 import pytest
 
 from pytest_data import get_data, use_data
@@ -45,11 +48,36 @@ def test_module_and_cls_and_function():
     assert data == {'a': 1, 'b': 20, 'c': 300, 'd': 4000, 'e': 5000}
 
 
+def test_dict_subclass():
+    data = _get_data(OrderedDict([('a', 1)]), function={'b': 2})
+    assert data == {'a': 1, 'b': 2}
+
+
+def test_unsupported_default():
+    with pytest.raises(ValueError):
+        _get_data((1, 2))
+
+
 def test_list_only_default():
     data = _get_data([{'a': 1}])
     assert data == [{'a': 1}]
 
 
+def test_list_empty():
+    data = _get_data([])
+    assert data == []
+
+
+def test_list_none_item():
+    data = _get_data([{'b': 2}], module=[None, {'a': 1}])
+    assert data == [{'b': 2}, {'b': 2, 'a': 1}]
+
+
+def test_list_pairs_item():
+    data = _get_data([{'b': 2}], module=[[('a', 1)]])
+    assert data == [{'a': 1, 'b': 2}]
+
+
 def test_list_mix_raises_module():
     with pytest.raises(ValueError):
         _get_data({'a': 1}, module=[{'b': 20}])
@@ -152,18 +180,22 @@ def test_list_more_values_module_cls_and_function():
     ]
 
 
-def _get_data(default, module=None, cls=None, function=None):
-    class request:
-        class module:
-            if module:
-                foo = module
-        class cls:
-            if cls:
-                foo = cls
-        class function:
-            if function:
-                foo = function
+class TestDataSetAtRuntime:
+    @pytest.mark.parametrize('target', ['module', 'cls'])
+    def test_data_set_at_runtime(self, request, monkeypatch, target):
+        assert get_data(request, 'runtime_data', {'a': 1}) == {'a': 1}
+        monkeypatch.setattr(getattr(request, target), 'runtime_data', {'b': 2}, raising=False)
+        assert get_data(request, 'runtime_data', {'a': 1}) == {'a': 1, 'b': 2}
+        monkeypatch.setattr(getattr(request, target), 'runtime_data', {'b': 3})
+        assert get_data(request, 'runtime_data', {'a': 1}) == {'a': 1, 'b': 3}
+
 
+def _get_data(default, module=None, cls=None, function=None):
+    request = SimpleNamespace(
+        module=SimpleNamespace(foo=module) if module else SimpleNamespace(),
+        cls=SimpleNamespace(foo=cls) if cls else SimpleNamespace(),
+        function=SimpleNamespace(foo=function) if function else SimpleNamespace(),
+    )
     return get_data(request, 'foo', default)
 
 
@@ -1,15 +1,25 @@
 #!/usr/bin/env python
 
+import os
+
 try:
     from setuptools import setup
 except ImportError:
     from distutils.core import setup
 
+# Optional ahead-of-time compilation of functions (the code running for every
+# fixture call) with mypyc. Pure Python module is used when not compiled.
+ext_modules = []
+if os.environ.get('PYTEST_DATA_MYPYC'):
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['pytest_data/functions.py'])
 
 setup(
     name='pytest-data',
     version='0.4',
     packages=['pytest_data'],
+    ext_modules=ext_modules,
+    python_requires='>=3.6',
 
     url='https://github.com/horejsek/python-pytest-data',
     author='Michal Horejsek',
@@ -19,7 +29,6 @@ setup(
 
     classifiers=[
         'Programming Language :: Python',
-        'Programming Language :: Python :: 2',
         'Programming Language :: Python :: 3',
         'License :: OSI Approved :: MIT License',
         'Operating System :: OS Independent',